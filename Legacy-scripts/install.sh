@@ -53,8 +53,10 @@ ensure_portainer() {
   local container_name="portainer"
   local volume_name="portainer_data"
 
-  if docker container inspect "$container_name" >/dev/null 2>&1; then
-    if ! docker ps --filter "name=^${container_name}$" --filter "status=running" --format '{{.Names}}' | grep -q "^${container_name}$"; then
+  local container_state
+  container_state="$(docker ps -a --filter "name=^${container_name}$" --format '{{.State}}' | head -n 1)"
+  if [[ -n "$container_state" ]]; then
+    if [[ "$container_state" != "running" ]]; then
       info "Starting existing Portainer container"
       docker start "$container_name" >/dev/null
     fi
@@ -92,12 +94,14 @@ setup_minio_container() {
 
   mkdir -p "$data_dir"
 
-  if docker container inspect "$container_name" >/dev/null 2>&1; then
+  local container_state
+  container_state="$(docker ps -a --filter "name=^${container_name}$" --format '{{.State}}' | head -n 1)"
+  if [[ -n "$container_state" ]]; then
     info "MinIO container '$container_name' already exists."
     if confirm "Recreate container with new configuration?"; then
       docker rm -f "$container_name" >/dev/null
     else
-      if ! docker ps --filter "name=^${container_name}$" --filter "status=running" --format '{{.Names}}' | grep -q "^${container_name}$"; then
+      if [[ "$container_state" != "running" ]]; then
         docker start "$container_name" >/dev/null
       fi
       success "Existing MinIO container will be reused (console: http://$SERVER_IP:$console_port)."
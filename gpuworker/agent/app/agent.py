@@ -2,32 +2,40 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import copy
 import errno
 import json
 import logging
 import mimetypes
+import os
 import re
 import secrets
 import shutil
+import stat
 import time
 import uuid
 from asyncio import Event
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache
 from math import isfinite
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from typing import Any, BinaryIO, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
 from urllib.parse import urljoin, urlparse, urlunparse
 
 import httpx
 
+try:  # orjson serializes straight to bytes and is several-fold faster than stdlib json
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
 from .assets import (
     build_collision_suffix,
     derive_pretty_name,
     ensure_extension,
-    must_be_allowed,
     normalize_name,
 )
 from .comfyui import (
@@ -39,13 +47,115 @@ from .comfyui import (
     extract_output_files,
 )
 from .config import AgentConfig
-from .minio_client import MinioManager, compute_sha256
+from .minio_client import MinioManager, hash_and_size
 from .models import AssetRef, DispatchEnvelope, Resolution
 from .workflow import WorkflowLoader, build_workflow_payload, find_save_image_nodes
 
 LOGGER = logging.getLogger(__name__)
 
 
+def _dump_json_bytes(payload: Any, *, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(payload, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+@lru_cache(maxsize=1024)
+def _resolve_callback_target(base: str, candidate: str) -> str:
+    """Resolve a callback URL against the configured base; memoized because
+    both inputs are constant for the life of a job's heartbeat stream."""
+    if not candidate:
+        raise ValueError("Callback URL cannot be empty")
+
+    if candidate.startswith("http://") or candidate.startswith("https://"):
+        if not base:
+            return candidate
+        parsed_base = urlparse(base)
+        if not parsed_base.scheme or not parsed_base.netloc:
+            return candidate
+        parsed_candidate = urlparse(candidate)
+        return urlunparse(
+            (
+                parsed_base.scheme,
+                parsed_base.netloc,
+                parsed_candidate.path or "/",
+                parsed_candidate.params,
+                parsed_candidate.query,
+                parsed_candidate.fragment,
+            )
+        )
+
+    if not base:
+        raise ValueError("Callback URL cannot be relative when no base URL configured")
+
+    normalized_base = f"{base.rstrip('/')}/"
+    normalized_candidate = candidate.lstrip("/")
+    return urljoin(normalized_base, normalized_candidate)
+
+
+def _bulk_unlink(files: List[Path], links: List[Path]) -> List[Tuple[Path, OSError]]:
+    """Remove regular files and (verified) symlinks, returning any failures.
+
+    Link candidates may have been materialized as real copies on filesystems
+    without symlink support, so each is lstat-checked before removal.
+    """
+    failures: List[Tuple[Path, OSError]] = []
+    for path in files:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            failures.append((path, exc))
+    for path in links:
+        try:
+            if stat.S_ISLNK(os.lstat(path).st_mode):
+                os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            failures.append((path, exc))
+    return failures
+
+
+def _fast_copy(source: Path, destination: Path) -> None:
+    """Copy file contents, staying in-kernel via copy_file_range when available."""
+
+    with source.open("rb") as src, destination.open("wb") as dst:
+        src_fd = src.fileno()
+        dst_fd = dst.fileno()
+        remaining = os.fstat(src_fd).st_size
+        if hasattr(os, "copy_file_range"):
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining == 0:
+                    return
+            except OSError:
+                LOGGER.debug("copy_file_range unavailable for %s; using buffered copy", source)
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
+        shutil.copyfileobj(src, dst, length=4 * 1024 * 1024)
+
+
+def _classify_path(path: Path) -> str:
+    """Classify *path* as ``file``/``symlink``/``missing``/``other`` with one lstat."""
+
+    try:
+        mode = os.lstat(path).st_mode
+    except OSError:
+        return "missing"
+    if stat.S_ISLNK(mode):
+        return "symlink"
+    if stat.S_ISREG(mode):
+        return "file"
+    return "other"
+
+
 SYMLINK_ERROR_CODES: Set[int] = {
     code
     for code in (
@@ -67,7 +177,7 @@ class SymlinkCreationUnsupported(RuntimeError):
         self.cause = cause
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolvedAsset:
     asset: AssetRef
     cache_path: Path
@@ -77,7 +187,7 @@ class ResolvedAsset:
     link_created: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ArtifactRecord:
     node_id: str
     filename: str
@@ -114,26 +224,27 @@ class ArtifactRecord:
         return payload
 
 
-@dataclass
+@dataclass(slots=True)
 class UploadResult:
     uploaded: List[str]
     missing: List[Path]
     artifacts: List[ArtifactRecord]
 
 
-@dataclass
+@dataclass(slots=True)
 class CancellationHandle:
     token: str
     event: Event
     job: DispatchEnvelope
 
 
-@dataclass
+@dataclass(slots=True)
 class JobLogHandle:
     job_id: str
     directory: Path
     manifest_path: Path
     events_path: Path
+    events_stream: Optional[BinaryIO] = None
 
 
 class FailureCategory(str, Enum):
@@ -160,27 +271,52 @@ class ValidationFailure(Exception):
     """Raised when the dispatch payload fails validation."""
 
 
-@dataclass
+@dataclass(slots=True)
 class JobRuntimeState:
     heartbeat_seq: int
-    started_at: datetime
+    started_at_iso: str
     started_monotonic: float
     prompt_id: Optional[str] = None
 
 
+@dataclass(slots=True)
+class JobContext:
+    """Per-job runtime state and log handle kept under a single registry entry."""
+
+    runtime: Optional[JobRuntimeState] = None
+    log: Optional[JobLogHandle] = None
+
+
 class GPUAgent:
-    _RESERVED_DEFAULT_KEYS: Set[str] = {
-        "prompt",
-        "negative_prompt",
-        "seed",
-        "steps",
-        "cfg_scale",
-        "width",
-        "height",
-        "sampler",
-        "scheduler",
-    }
-    _RESERVED_KEYS_WITH_DEFAULTS: Set[str] = {"sampler", "scheduler"}
+    _RESERVED_DEFAULT_KEYS: FrozenSet[str] = frozenset(
+        {
+            "prompt",
+            "negative_prompt",
+            "seed",
+            "steps",
+            "cfg_scale",
+            "width",
+            "height",
+            "sampler",
+            "scheduler",
+        }
+    )
+    _RESERVED_KEYS_WITH_DEFAULTS: FrozenSet[str] = frozenset({"sampler", "scheduler"})
+    _SKIP_EXTRA_KEYS: FrozenSet[str] = frozenset(
+        {
+            "loras",
+            "primary_lora_name",
+            "primary_lora_strength_model",
+            "primary_lora_strength_clip",
+        }
+    )
+    _SLUG_RE = re.compile(r"[^A-Za-z0-9_-]+")
+    _TERMINAL_STATES: FrozenSet[GeneratorState] = frozenset(
+        {GeneratorState.SUCCESS, GeneratorState.FAILED, GeneratorState.CANCELED}
+    )
+    _DISPLAY_NAME_TTL_SECONDS = 300.0
+    _DISPLAY_NAME_CACHE_MAX = 256
+    _LORA_MATCH_FIELDS: Tuple[str, ...] = ("filename", "key", "name", "title", "id", "slug")
 
     def __init__(self, config: AgentConfig) -> None:
         self.config = config
@@ -188,21 +324,55 @@ class GPUAgent:
         self.comfyui = ComfyUIClient(config)
         self.workflow_loader = WorkflowLoader(config, self.minio)
         self._lock = asyncio.Lock()
+        self._busy = False
         self._cancel_handle: Optional[CancellationHandle] = None
-        self._runtime: Dict[str, JobRuntimeState] = {}
+        self._jobs: Dict[str, JobContext] = {}
+        # One pooled client for all callback traffic; keep-alive avoids a fresh
+        # TCP/TLS handshake per status heartbeat. Transport-level retries cover
+        # connection setup failures without tearing down the pool, leaving the
+        # retry loop in _post_callback to handle HTTP-level errors.
+        self._http = httpx.AsyncClient(
+            timeout=httpx.Timeout(config.callbacks.timeout_seconds, connect=3.0),
+            transport=httpx.AsyncHTTPTransport(
+                retries=3,
+                verify=config.callbacks.verify_tls,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            ),
+        )
+        # Latest non-terminal heartbeat per job; a background task flushes the
+        # map so a dense progress stream costs one POST per flush window.
+        self._pending_status: Dict[str, Tuple[str, Dict[str, Any], str]] = {}
+        self._status_event = asyncio.Event()
+        self._status_flusher: Optional["asyncio.Task[None]"] = None
+        self._activity_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._activity_lock = asyncio.Lock()
         self._symlink_support: Dict[Path, bool] = {}
+        self._resolved_dirs: Dict[Path, Path] = {}
+        self._base_model_cache: "OrderedDict[Tuple[str, str, str, str], ResolvedAsset]" = OrderedDict()
+        # Metadata-derived display names, stored as (expiry, name) and bounded
+        # so a controller-side rename surfaces after the TTL at the latest.
+        self._display_name_cache: "OrderedDict[Tuple[str, str], Tuple[float, Optional[str]]]" = OrderedDict()
         self._job_log_dir = config.paths.outputs / "logs"
-        self._job_logs: Dict[str, JobLogHandle] = {}
+
+    async def aclose(self) -> None:
+        if self._status_flusher is not None:
+            self._status_flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._status_flusher
+        await self._http.aclose()
+        await self.comfyui.close()
 
     def is_busy(self) -> bool:
-        return self._lock.locked()
+        # Plain attribute read; no coroutine machinery needed for the health probe.
+        return self._busy
 
     async def try_reserve_job(self) -> bool:
         """Attempt to reserve the execution lock without waiting."""
 
-        if self._lock.locked():
+        if self._busy or self._lock.locked():
             return False
         await self._lock.acquire()
+        self._busy = True
         return True
 
     async def run_reserved_job(self, job: DispatchEnvelope) -> Dict[str, List[str]]:
@@ -211,11 +381,16 @@ class GPUAgent:
         try:
             return await self._execute(job)
         finally:
+            self._busy = False
             self._lock.release()
 
     async def handle_job(self, job: DispatchEnvelope) -> Dict[str, List[str]]:
         async with self._lock:
-            return await self._execute(job)
+            self._busy = True
+            try:
+                return await self._execute(job)
+            finally:
+                self._busy = False
 
     async def request_cancel(self, token: str) -> bool:
         handle = self._cancel_handle
@@ -224,7 +399,8 @@ class GPUAgent:
             return False
         if not handle.event.is_set():
             LOGGER.info("Received cancellation request for job %s", handle.job.jobId)
-            self._log_job_event(self._job_logs.get(handle.job.jobId), "cancel_requested", None)
+            context = self._jobs.get(handle.job.jobId)
+            self._log_job_event(context.log if context else None, "cancel_requested", None)
             handle.event.set()
             try:
                 await self._emit_status(
@@ -237,8 +413,21 @@ class GPUAgent:
                 LOGGER.debug("Failed to emit cancellation status for %s", handle.job.jobId, exc_info=True)
         return True
 
-    async def describe_activity(self) -> Dict[str, Any]:
-        return await self.comfyui.describe_activity()
+    async def describe_activity(self, *, max_age: float = 0.25) -> Dict[str, Any]:
+        # Heartbeats fired within the window share one ComfyUI round-trip;
+        # callers that need a fresh snapshot pass max_age=0.
+        cached = self._activity_cache
+        if cached is not None and max_age > 0 and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+        # Single-flight: concurrent callers within the window share the fetch
+        # instead of each issuing their own queue query.
+        async with self._activity_lock:
+            cached = self._activity_cache
+            if cached is not None and max_age > 0 and time.monotonic() - cached[0] < max_age:
+                return cached[1]
+            activity = await self.comfyui.describe_activity()
+            self._activity_cache = (time.monotonic(), activity)
+        return activity
 
     async def _execute(self, job: DispatchEnvelope) -> Dict[str, List[str]]:
         LOGGER.info("Starting job %s for user %s", job.jobId, job.user.username)
@@ -260,8 +449,8 @@ class GPUAgent:
         )
         prompt_id: Optional[str] = None
         try:
-            resolved_base = self._ensure_base_model(job.baseModel)
-            resolved_loras = self._ensure_loras(job)
+            resolved_base = await asyncio.to_thread(self._ensure_base_model, job.baseModel)
+            resolved_loras = await asyncio.to_thread(self._ensure_loras, job)
             needs_refresh = self._needs_model_refresh(resolved_base, resolved_loras)
             if needs_refresh:
                 await self._refresh_model_cache()
@@ -276,7 +465,8 @@ class GPUAgent:
             await self._ensure_lora_visibility(resolved_loras)
             await self._persist_applied_workflow(job_log, job, workflow_payload)
             await self._update_job_manifest(job_log, job, resolved_params, workflow_payload)
-            await self._validate_workflow_assets(workflow_payload)
+            has_low_denoise, string_inputs = self._summarize_workflow(workflow_payload)
+            await self._validate_workflow_assets(string_inputs)
 
             self._log_job_event(
                 job_log,
@@ -312,7 +502,7 @@ class GPUAgent:
                 {"prompt_id": prompt_id},
             )
 
-            timeout = self._compute_timeout(job, workflow_payload, resolved_params)
+            timeout = self._compute_timeout(job, resolved_params, low_denoise=has_low_denoise)
             history = await self.comfyui.wait_for_completion(
                 prompt_id,
                 timeout=timeout,
@@ -330,7 +520,9 @@ class GPUAgent:
             if save_nodes and not outputs:
                 raise ValidationFailure("Workflow completed without producing outputs from SaveImage nodes")
 
-            upload_result = self._upload_outputs(job, outputs, resolved_base, resolved_loras, resolved_params)
+            upload_result = await self._upload_outputs(
+                job, outputs, resolved_base, resolved_loras, resolved_params
+            )
             if upload_result.missing:
                 missing_names = ", ".join(path.name for path in upload_result.missing)
                 warnings.append(f"Missing outputs on disk: {missing_names}")
@@ -414,10 +606,9 @@ class GPUAgent:
                     "finalized",
                     {"duration_seconds": round(duration, 3)},
                 )
-            self._cleanup(resolved_base, resolved_loras)
+            await self._cleanup(resolved_base, resolved_loras)
             self._clear_cancellation(cancel_handle)
-            self._clear_runtime(job.jobId)
-            self._clear_job_log(job.jobId)
+            self._clear_job_context(job.jobId)
 
     def _register_cancellation(self, job: DispatchEnvelope) -> Optional[CancellationHandle]:
         token = (job.cancelToken or "").strip()
@@ -433,26 +624,32 @@ class GPUAgent:
             self._cancel_handle = None
 
     def _start_runtime(self, job: DispatchEnvelope) -> JobRuntimeState:
+        # Terminal callbacks only need the formatted timestamp, so render it
+        # once here instead of per emission.
         state = JobRuntimeState(
             heartbeat_seq=0,
-            started_at=datetime.now(timezone.utc),
+            started_at_iso=datetime.now(timezone.utc)
+            .isoformat(timespec="milliseconds")
+            .replace("+00:00", "Z"),
             started_monotonic=time.perf_counter(),
         )
-        self._runtime[job.jobId] = state
+        self._jobs.setdefault(job.jobId, JobContext()).runtime = state
         return state
 
     def _get_runtime(self, job_id: str) -> Optional[JobRuntimeState]:
-        return self._runtime.get(job_id)
-
-    def _clear_runtime(self, job_id: str) -> None:
-        self._runtime.pop(job_id, None)
+        context = self._jobs.get(job_id)
+        return context.runtime if context else None
 
-    def _clear_job_log(self, job_id: str) -> None:
-        self._job_logs.pop(job_id, None)
+    def _clear_job_context(self, job_id: str) -> None:
+        context = self._jobs.pop(job_id, None)
+        if context and context.log and context.log.events_stream is not None:
+            with contextlib.suppress(Exception):
+                context.log.events_stream.close()
 
     def _now_iso(self) -> str:
-        now = datetime.now(timezone.utc)
-        return now.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+        # isoformat on an aware UTC datetime always ends in "+00:00"; slicing the
+        # fixed-width offset off is cheaper than scanning the string with replace.
+        return datetime.now(timezone.utc).isoformat(timespec="milliseconds")[:-6] + "Z"
 
     def _create_job_log(self, job: DispatchEnvelope) -> Optional[JobLogHandle]:
         base_dir = self._job_log_dir
@@ -479,17 +676,17 @@ class GPUAgent:
         }
         try:
             job_dir.mkdir(parents=True, exist_ok=True)
-            with manifest_path.open("w", encoding="utf-8") as handle:
-                json.dump(manifest_payload, handle, indent=2, ensure_ascii=False)
-                handle.write("\n")
+            manifest_path.write_bytes(_dump_json_bytes(manifest_payload, indent=True) + b"\n")
             events_path = job_dir / "events.jsonl"
-            events_path.touch(exist_ok=True)
+            # Unbuffered append handle: one write syscall per event, no reopen per
+            # call, and O_APPEND keeps each record atomic on the log file.
+            events_stream = events_path.open("ab", buffering=0)
         except Exception:  # noqa: BLE001
             LOGGER.exception("Failed to persist manifest for job %s", job.jobId)
             return None
 
-        log_handle = JobLogHandle(job.jobId, job_dir, manifest_path, events_path)
-        self._job_logs[job.jobId] = log_handle
+        log_handle = JobLogHandle(job.jobId, job_dir, manifest_path, events_path, events_stream)
+        self._jobs.setdefault(job.jobId, JobContext()).log = log_handle
         return log_handle
 
     def _log_job_event(
@@ -504,9 +701,15 @@ class GPUAgent:
         if details:
             entry["details"] = details
         try:
-            with log_handle.events_path.open("a", encoding="utf-8") as stream:
-                json.dump(entry, stream, ensure_ascii=False)
-                stream.write("\n")
+            if orjson is not None:
+                line = orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+            else:
+                line = _dump_json_bytes(entry) + b"\n"
+            if log_handle.events_stream is not None and not log_handle.events_stream.closed:
+                log_handle.events_stream.write(line)
+            else:
+                with log_handle.events_path.open("ab") as stream:
+                    stream.write(line)
         except Exception:  # noqa: BLE001
             LOGGER.warning(
                 "Failed to record %s event for job %s", event, log_handle.job_id, exc_info=True
@@ -519,19 +722,20 @@ class GPUAgent:
         job: DispatchEnvelope,
         resolved_params: Dict[str, object],
     ) -> Dict[str, Any]:
-        details: Dict[str, Any] = {
-            "base_model": base_model.comfy_name if base_model else None,
-            "loras": [lora.comfy_name for lora in loras] if loras else [],
-            "output_bucket": job.output.bucket,
-            "output_prefix": job.output.prefix,
-        }
+        # Assemble conditionally instead of filtering afterwards so each event
+        # allocates a single dict.
+        details: Dict[str, Any] = {}
+        if base_model is not None:
+            details["base_model"] = base_model.comfy_name
+        details["loras"] = [lora.comfy_name for lora in loras] if loras else []
+        details["output_bucket"] = job.output.bucket
+        if job.output.prefix is not None:
+            details["output_prefix"] = job.output.prefix
         resolution = job.parameters.resolution
         if resolution:
             details["resolution"] = {"width": resolution.width, "height": resolution.height}
-        prompt_text = resolved_params.get("prompt") or job.parameters.prompt or ""
-        negative_text = resolved_params.get("negative_prompt") or job.parameters.negativePrompt or ""
-        details["prompt"] = prompt_text
-        details["negative_prompt"] = negative_text
+        details["prompt"] = resolved_params.get("prompt") or job.parameters.prompt or ""
+        details["negative_prompt"] = resolved_params.get("negative_prompt") or job.parameters.negativePrompt or ""
         seed = resolved_params.get("seed", job.parameters.seed)
         if seed is not None:
             details["seed"] = seed
@@ -542,12 +746,12 @@ class GPUAgent:
         if steps is not None:
             details["steps"] = steps
         sampler = resolved_params.get("sampler")
-        scheduler = resolved_params.get("scheduler")
         if sampler is not None:
             details["sampler"] = sampler
+        scheduler = resolved_params.get("scheduler")
         if scheduler is not None:
             details["scheduler"] = scheduler
-        return {key: value for key, value in details.items() if value not in (None, {})}
+        return details
 
     def _build_completion_log(
         self,
@@ -612,31 +816,25 @@ class GPUAgent:
             if job.parameters.resolution
             else self._coerce_simple_value(resolved_params.get("height"))
         )
-        params: Dict[str, Any] = {
-            "model": base_model.comfy_name,
-            "vae": self._coerce_simple_value(
-                resolved_params.get("vae_name") or resolved_params.get("vae")
-            ),
-            "clip": self._coerce_simple_value(
-                resolved_params.get("clip_name") or resolved_params.get("clip")
-            ),
-            "seed": job.parameters.seed,
-            "steps": job.parameters.steps
-            or self._coerce_simple_value(resolved_params.get("steps")),
-            "cfg": job.parameters.cfgScale or cfg_value,
-            "sampler": self._coerce_simple_value(resolved_params.get("sampler")),
-            "scheduler": self._coerce_simple_value(resolved_params.get("scheduler")),
-            "denoise": self._coerce_simple_value(resolved_params.get("denoise")),
-            "width": width_value,
-            "height": height_value,
-        }
-        lora_entries = [
-            {"name": entry.comfy_name}
-            for entry in loras
+        params: Dict[str, Any] = {"model": base_model.comfy_name}
+        candidates: List[Tuple[str, Any]] = [
+            ("vae", self._coerce_simple_value(resolved_params.get("vae_name") or resolved_params.get("vae"))),
+            ("clip", self._coerce_simple_value(resolved_params.get("clip_name") or resolved_params.get("clip"))),
+            ("seed", job.parameters.seed),
+            ("steps", job.parameters.steps or self._coerce_simple_value(resolved_params.get("steps"))),
+            ("cfg", job.parameters.cfgScale or cfg_value),
+            ("sampler", self._coerce_simple_value(resolved_params.get("sampler"))),
+            ("scheduler", self._coerce_simple_value(resolved_params.get("scheduler"))),
+            ("denoise", self._coerce_simple_value(resolved_params.get("denoise"))),
+            ("width", width_value),
+            ("height", height_value),
         ]
-        if lora_entries:
-            params["loras"] = lora_entries
-        return {key: value for key, value in params.items() if value is not None}
+        for key, value in candidates:
+            if value is not None:
+                params[key] = value
+        if loras:
+            params["loras"] = [{"name": entry.comfy_name} for entry in loras]
+        return params
 
     def _map_failure_reason_code(self, category: FailureCategory) -> str:
         mapping = {
@@ -649,10 +847,9 @@ class GPUAgent:
         return mapping.get(category, "SYSTEM_ERROR")
 
     def _needs_model_refresh(self, base: Optional[ResolvedAsset], loras: List[ResolvedAsset]) -> bool:
-        candidates: Iterable[ResolvedAsset] = [asset for asset in loras]
-        if base:
-            candidates = list(candidates) + [base]
-        return any(asset.downloaded or asset.link_created for asset in candidates)
+        if base and (base.downloaded or base.link_created):
+            return True
+        return any(asset.downloaded or asset.link_created for asset in loras)
 
     async def _refresh_model_cache(self) -> None:
         self.comfyui.invalidate_object_cache()
@@ -660,11 +857,31 @@ class GPUAgent:
         if delay:
             await asyncio.sleep(delay)
 
+    def _write_symlink_sentinel(self, sentinel: Path, supported: bool) -> None:
+        try:
+            sentinel.write_text("1" if supported else "0", encoding="utf-8")
+        except OSError:
+            LOGGER.debug("Failed to persist symlink capability marker %s", sentinel, exc_info=True)
+
     def _supports_symlinks(self, directory: Path) -> bool:
-        resolved = directory.resolve()
+        # Memoize mkdir + resolve(): both stat every path component and the probed
+        # directories are a small fixed set that never moves during a process.
+        resolved = self._resolved_dirs.get(directory)
+        if resolved is None:
+            directory.mkdir(parents=True, exist_ok=True)
+            resolved = directory.resolve()
+            self._resolved_dirs[directory] = resolved
         if resolved in self._symlink_support:
             return self._symlink_support[resolved]
-        directory.mkdir(parents=True, exist_ok=True)
+        sentinel = directory / ".vs-symlink-capability"
+        try:
+            cached = sentinel.read_text(encoding="utf-8").strip()
+        except OSError:
+            cached = ""
+        if cached in {"0", "1"}:
+            supported = cached == "1"
+            self._symlink_support[resolved] = supported
+            return supported
         token = uuid.uuid4().hex
         target = directory / f".vs-symlink-probe-target-{token}"
         link = directory / f".vs-symlink-probe-link-{token}"
@@ -680,6 +897,7 @@ class GPUAgent:
                     exc,
                 )
                 self._symlink_support[resolved] = False
+                self._write_symlink_sentinel(sentinel, False)
                 return False
             raise
         finally:
@@ -688,6 +906,7 @@ class GPUAgent:
             with contextlib.suppress(FileNotFoundError):
                 target.unlink()
         self._symlink_support[resolved] = True
+        self._write_symlink_sentinel(sentinel, True)
         return True
 
     def _materialize_without_symlink(
@@ -723,17 +942,78 @@ class GPUAgent:
                             "Migrated cached %s %s into %s", asset_kind, candidate, pretty_path
                         )
                         break
+                    except OSError as exc:
+                        if exc.errno != errno.EXDEV:
+                            LOGGER.debug(
+                                "Failed to migrate cached %s %s into %s", asset_kind, candidate, pretty_path, exc_info=True
+                            )
+                            continue
+                        # rename cannot cross filesystems; copy in-kernel instead
+                        # of falling through to a fresh multi-GB download. Stage
+                        # under a temp name so a failed copy never leaves a
+                        # partial file that the existence check below would
+                        # accept as a complete asset.
+                        tmp_path = pretty_path.with_name(pretty_path.name + ".tmp")
+                        try:
+                            _fast_copy(candidate, tmp_path)
+                            os.replace(tmp_path, pretty_path)
+                            candidate.unlink(missing_ok=True)
+                            LOGGER.debug(
+                                "Copied cached %s %s into %s across filesystems", asset_kind, candidate, pretty_path
+                            )
+                            break
+                        except Exception:  # noqa: BLE001
+                            tmp_path.unlink(missing_ok=True)
+                            LOGGER.debug(
+                                "Failed to copy cached %s %s into %s", asset_kind, candidate, pretty_path, exc_info=True
+                            )
                     except Exception:  # noqa: BLE001
                         LOGGER.debug(
                             "Failed to migrate cached %s %s into %s", asset_kind, candidate, pretty_path, exc_info=True
                         )
             if not pretty_path.exists():
                 LOGGER.info("Downloading %s %s", asset_kind, asset.key)
-                self.minio.download_to_path(asset.bucket, asset.key, pretty_path)
+                self.minio.download_to_path(
+                    asset.bucket, asset.key, pretty_path, expected_sha256=asset.checksum
+                )
                 downloaded = True
         return pretty_path, downloaded, created
 
     def _ensure_base_model(self, base_model: AssetRef) -> ResolvedAsset:
+        # The naming inputs are part of the key: a rename in the controller
+        # must derive a fresh pretty name instead of replaying the cached one.
+        cache_key = (
+            base_model.bucket,
+            base_model.key,
+            base_model.display_name or "",
+            base_model.original_name or "",
+        )
+        cached = self._base_model_cache.get(cache_key)
+        if cached is not None:
+            try:
+                os.lstat(cached.symlink_path)
+                os.lstat(cached.cache_path)
+            except OSError:
+                self._base_model_cache.pop(cache_key, None)
+            else:
+                self._base_model_cache.move_to_end(cache_key)
+                return ResolvedAsset(
+                    asset=base_model,
+                    cache_path=cached.cache_path,
+                    comfy_name=cached.comfy_name,
+                    symlink_path=cached.symlink_path,
+                    downloaded=False,
+                    link_created=False,
+                )
+        resolved = self._resolve_base_model(base_model)
+        max_entries = self.config.asset_cache_size
+        if max_entries > 0:
+            self._base_model_cache[cache_key] = resolved
+            while len(self._base_model_cache) > max_entries:
+                self._base_model_cache.popitem(last=False)
+        return resolved
+
+    def _resolve_base_model(self, base_model: AssetRef) -> ResolvedAsset:
         base_dir = self.config.paths.base_models
         cache_dir = base_dir / "cache"
         cache_dir.mkdir(parents=True, exist_ok=True)
@@ -745,25 +1025,28 @@ class GPUAgent:
 
         use_symlink = self._supports_symlinks(base_dir)
 
-        cache_path = (
-            pretty_path
-            if not use_symlink
-            and pretty_path.exists()
-            and pretty_path.is_file()
-            and not pretty_path.is_symlink()
-            else cache_dir / cache_name
-        )
+        # One lstat classifies the pretty path; a materialized real file doubles
+        # as the cache and needs no further presence checks.
+        if not use_symlink and _classify_path(pretty_path) == "file":
+            cache_path = pretty_path
+            cache_exists = True
+        else:
+            cache_path = cache_dir / cache_name
+            cache_exists = os.path.exists(cache_path)
         legacy_cache = cache_dir / source_name
-        if not cache_path.exists() and legacy_cache.exists():
+        if not cache_exists and os.path.exists(legacy_cache):
             try:
                 legacy_cache.rename(cache_path)
+                cache_exists = True
                 LOGGER.debug("Migrated legacy base model cache %s to %s", legacy_cache, cache_path)
             except Exception:  # noqa: BLE001
                 LOGGER.debug("Failed to migrate legacy cache %s", legacy_cache, exc_info=True)
         downloaded = False
-        if not cache_path.exists():
+        if not cache_exists:
             LOGGER.info("Downloading base model %s", base_model.key)
-            self.minio.download_to_path(base_model.bucket, base_model.key, cache_path)
+            self.minio.download_to_path(
+                base_model.bucket, base_model.key, cache_path, expected_sha256=base_model.checksum
+            )
             downloaded = True
 
         if not use_symlink:
@@ -851,7 +1134,23 @@ class GPUAgent:
                 exc_info=True,
             )
             desired.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(cache_path, desired)
+            try:
+                # A hardlink publishes the file in O(1) when both ends share a
+                # device, sparing the full copy of a multi-GB LoRA.
+                if os.stat(cache_path).st_dev == os.stat(desired.parent).st_dev:
+                    os.link(cache_path, desired)
+                    cache_path.unlink(missing_ok=True)
+                    LOGGER.debug(
+                        "Hardlinked primary LoRA cache %s to %s after rename failure",
+                        cache_path,
+                        desired,
+                    )
+                    return desired
+            except OSError:
+                LOGGER.debug(
+                    "Hardlink fallback failed for %s", desired, exc_info=True
+                )
+            _fast_copy(cache_path, desired)
             cache_path.unlink(missing_ok=True)
             LOGGER.debug(
                 "Copied primary LoRA cache %s into %s after rename failure",
@@ -860,6 +1159,80 @@ class GPUAgent:
             )
             return desired
 
+    def _index_legacy_cache(self, legacy_cache_dir: Path) -> Set[str]:
+        """List the legacy cache once instead of stat-probing candidates per LoRA."""
+        try:
+            return set(os.listdir(legacy_cache_dir))
+        except OSError:
+            return set()
+
+    def _prefetch_lora_downloads(
+        self,
+        job: DispatchEnvelope,
+        cache_dir: Path,
+        legacy_cache_dir: Path,
+    ) -> Set[Path]:
+        """Download missing LoRA cache files in parallel ahead of the serial resolve loop."""
+
+        if not self._supports_symlinks(cache_dir):
+            # Without symlink support the resolve loop renames cache files into
+            # their pretty names, so probing cache paths here would re-download
+            # (and never clean up) every already-materialized LoRA.
+            return set()
+        pending: List[Tuple[AssetRef, Path]] = []
+        seen: Set[Path] = set()
+        legacy_index = self._index_legacy_cache(legacy_cache_dir)
+        for asset in job.loras:
+            source_name = Path(asset.key).name
+            cache_path = cache_dir / ensure_extension(source_name)
+            if cache_path in seen or cache_path.exists():
+                continue
+            if cache_path.name in legacy_index or source_name in legacy_index:
+                continue
+            seen.add(cache_path)
+            pending.append((asset, cache_path))
+        if len(pending) < 2:
+            return set()
+
+        workers = min(len(pending), max(1, self.config.minio.parallel_downloads))
+        prefetched: Set[Path] = set()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(self._download_lora_atomic, asset, path): path
+                for asset, path in pending
+            }
+            for future in as_completed(futures):
+                future.result()
+                prefetched.add(futures[future])
+        return prefetched
+
+    def _download_lora_atomic(self, asset: AssetRef, cache_path: Path) -> None:
+        # Land the bytes under a temporary name and publish with an atomic
+        # rename so a concurrent resolve loop never sees a partial file.
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            self.minio.download_to_path(
+                asset.bucket, asset.key, tmp_path, expected_sha256=asset.checksum
+            )
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _cached_lstat(
+        self, cache: Dict[Path, Optional[os.stat_result]], path: Path
+    ) -> Optional[os.stat_result]:
+        """Memoized lstat; a `None` entry records that the path is absent."""
+        try:
+            return cache[path]
+        except KeyError:
+            try:
+                result: Optional[os.stat_result] = os.lstat(path)
+            except OSError:
+                result = None
+            cache[path] = result
+            return result
+
     def _ensure_loras(self, job: DispatchEnvelope) -> List[ResolvedAsset]:
         resolved: List[ResolvedAsset] = []
         if not job.loras:
@@ -869,10 +1242,16 @@ class GPUAgent:
         cache_dir = self.config.paths.loras
         legacy_cache_dir = cache_dir / "cache"
         cache_dir.mkdir(parents=True, exist_ok=True)
+        prefetched = self._prefetch_lora_downloads(job, cache_dir, legacy_cache_dir)
+        self._prefetch_display_names(job.loras)
 
         use_symlink = self._supports_symlinks(cache_dir)
 
         used_visible: Set[str] = set()
+        # One lstat per distinct path for the whole resolve pass; entries are
+        # dropped whenever a rename/download changes what is on disk.
+        stat_cache: Dict[Path, Optional[os.stat_result]] = {}
+        legacy_index = self._index_legacy_cache(legacy_cache_dir)
 
         for index, asset in enumerate(job.loras):
             source_name = Path(asset.key).name
@@ -886,21 +1265,23 @@ class GPUAgent:
                 display_candidate = self._resolve_display_name(asset, override)
             visible_name = self._build_visible_lora_name(job, asset, display_candidate, index, used_visible)
             pretty_path = cache_dir / visible_name
+            pretty_stat = self._cached_lstat(stat_cache, pretty_path)
             cache_path = (
                 pretty_path
                 if not use_symlink
-                and pretty_path.exists()
-                and pretty_path.is_file()
-                and not pretty_path.is_symlink()
+                and pretty_stat is not None
+                and stat.S_ISREG(pretty_stat.st_mode)
                 else cache_dir / cache_name
             )
-            if not cache_path.exists() and legacy_cache_dir.exists():
-                legacy_candidates = [legacy_cache_dir / cache_name, legacy_cache_dir / source_name]
-                for legacy_cache in legacy_candidates:
-                    if not legacy_cache.exists():
+            if self._cached_lstat(stat_cache, cache_path) is None and legacy_index:
+                for legacy_name in (cache_name, source_name):
+                    if legacy_name not in legacy_index:
                         continue
+                    legacy_cache = legacy_cache_dir / legacy_name
                     try:
                         legacy_cache.rename(cache_path)
+                        legacy_index.discard(legacy_name)
+                        stat_cache.pop(cache_path, None)
                         LOGGER.debug(
                             "Migrated legacy LoRA cache %s to %s",
                             legacy_cache,
@@ -913,14 +1294,21 @@ class GPUAgent:
                             legacy_cache,
                             exc_info=True,
                         )
-            downloaded = False
-            if not cache_path.exists():
+            downloaded = cache_path in prefetched
+            if self._cached_lstat(stat_cache, cache_path) is None:
                 LOGGER.info("Downloading LoRA %s", asset.key)
-                self.minio.download_to_path(asset.bucket, asset.key, cache_path)
+                self.minio.download_to_path(
+                    asset.bucket, asset.key, cache_path, expected_sha256=asset.checksum
+                )
+                stat_cache.pop(cache_path, None)
                 downloaded = True
 
             if is_primary and cache_path.parent == cache_dir:
-                cache_path = self._prepare_primary_lora_cache(cache_dir, cache_path, override)
+                renamed = self._prepare_primary_lora_cache(cache_dir, cache_path, override)
+                if renamed != cache_path:
+                    stat_cache.pop(cache_path, None)
+                    stat_cache.pop(renamed, None)
+                cache_path = renamed
                 cache_name = cache_path.name
             elif cache_path.parent == cache_dir:
                 cache_name = cache_path.name
@@ -990,11 +1378,69 @@ class GPUAgent:
                 )
         return resolved
 
+    def _get_cached_display_name(self, cache_key: Tuple[str, str]) -> Optional[Tuple[Optional[str]]]:
+        """Return a 1-tuple holding the cached name, or ``None`` on miss/expiry."""
+
+        entry = self._display_name_cache.get(cache_key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[0]:
+            self._display_name_cache.pop(cache_key, None)
+            return None
+        self._display_name_cache.move_to_end(cache_key)
+        return (entry[1],)
+
+    def _store_display_name(self, cache_key: Tuple[str, str], value: Optional[str]) -> None:
+        cache = self._display_name_cache
+        cache[cache_key] = (time.monotonic() + self._DISPLAY_NAME_TTL_SECONDS, value)
+        cache.move_to_end(cache_key)
+        while len(cache) > self._DISPLAY_NAME_CACHE_MAX:
+            cache.popitem(last=False)
+
+    def _prefetch_display_names(self, assets: Sequence[AssetRef]) -> None:
+        """Resolve pending display-name HEAD lookups as one parallel batch."""
+
+        pending: List[AssetRef] = []
+        seen: Set[Tuple[str, str]] = set()
+        for asset in assets:
+            if asset.display_name or asset.original_name:
+                continue
+            cache_key = (asset.bucket, asset.key)
+            if cache_key in seen or self._get_cached_display_name(cache_key) is not None:
+                continue
+            seen.add(cache_key)
+            pending.append(asset)
+        if len(pending) < 2:
+            return
+        workers = min(len(pending), max(1, self.config.minio.parallel_downloads))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(self.minio.get_object_metadata, asset.bucket, asset.key): (
+                    asset.bucket,
+                    asset.key,
+                )
+                for asset in pending
+            }
+            for future in as_completed(futures):
+                metadata = future.result()
+                self._store_display_name(
+                    futures[future],
+                    metadata.get("original-name")
+                    or metadata.get("original_name")
+                    or metadata.get("display-name"),
+                )
+
     def _resolve_display_name(self, asset: AssetRef, fallback: str) -> str:
         candidate = asset.display_name or asset.original_name
         if not candidate:
-            metadata = self.minio.get_object_metadata(asset.bucket, asset.key)
-            candidate = metadata.get("original-name") or metadata.get("original_name") or metadata.get("display-name")
+            cache_key = (asset.bucket, asset.key)
+            cached = self._get_cached_display_name(cache_key)
+            if cached is not None:
+                candidate = cached[0]
+            else:
+                metadata = self.minio.get_object_metadata(asset.bucket, asset.key)
+                candidate = metadata.get("original-name") or metadata.get("original_name") or metadata.get("display-name")
+                self._store_display_name(cache_key, candidate)
         return derive_pretty_name(candidate, fallback)
 
     def _ensure_symlink(
@@ -1009,45 +1455,61 @@ class GPUAgent:
         desired.parent.mkdir(parents=True, exist_ok=True)
         suffix = build_collision_suffix(source_key)
         candidate = desired
+        target_repr = os.fspath(target)
         while True:
-            if candidate.exists() or candidate.is_symlink():
-                try:
-                    if candidate.samefile(target):
-                        return candidate, False
-                except FileNotFoundError:
-                    try:
-                        candidate.unlink()
-                    except FileNotFoundError:
-                        pass
-                    continue
-                if replace_existing:
-                    try:
-                        candidate.unlink()
-                    except IsADirectoryError:
-                        shutil.rmtree(candidate)
-                    except FileNotFoundError:
-                        pass
-                    continue
-                new_name = f"{candidate.stem}__{suffix}{candidate.suffix or target.suffix or '.safetensors'}"
-                candidate = candidate.with_name(new_name)
-                continue
+            # Attempt the symlink first and sort out collisions from EEXIST;
+            # the common no-collision path then costs one syscall instead of
+            # two lstat probes per candidate.
             try:
                 candidate.symlink_to(target)
+                return candidate, True
+            except FileExistsError:
+                pass
             except OSError as exc:  # noqa: BLE001
                 winerror = getattr(exc, "winerror", None)
                 if exc.errno in SYMLINK_ERROR_CODES or winerror in {1314}:
                     resolved_parent = candidate.parent.resolve()
                     self._symlink_support[resolved_parent] = False
+                    self._write_symlink_sentinel(
+                        candidate.parent / ".vs-symlink-capability", False
+                    )
                     raise SymlinkCreationUnsupported(resolved_parent, exc) from exc
                 raise
-            return candidate, True
+            try:
+                if os.readlink(candidate) == target_repr:
+                    return candidate, False
+            except OSError:
+                pass
+            try:
+                if candidate.samefile(target):
+                    return candidate, False
+            except FileNotFoundError:
+                try:
+                    candidate.unlink()
+                except FileNotFoundError:
+                    pass
+                continue
+            if replace_existing:
+                try:
+                    candidate.unlink()
+                except IsADirectoryError:
+                    shutil.rmtree(candidate)
+                except FileNotFoundError:
+                    pass
+                continue
+            new_name = f"{candidate.stem}__{suffix}{candidate.suffix or target.suffix or '.safetensors'}"
+            candidate = candidate.with_name(new_name)
 
     def _build_lora_filename_lookup(self, job: DispatchEnvelope) -> Dict[str, str]:
-        lookup: Dict[str, str] = {}
         extra = job.parameters.extra or {}
         lora_entries = extra.get("loras")
         if not isinstance(lora_entries, list):
-            return lookup
+            return {}
+        _norm = normalize_name
+        # Collect pairs and build the dict in one C-level pass; later pairs
+        # win on duplicate keys, matching the old per-item assignment order.
+        items: List[Tuple[str, str]] = []
+        append = items.append
         for entry in lora_entries:
             if not isinstance(entry, dict):
                 continue
@@ -1056,20 +1518,18 @@ class GPUAgent:
                 filename = entry.get("originalName")
             if not isinstance(filename, str):
                 continue
-            sanitized = normalize_name(filename)
+            sanitized = _norm(filename)
             if not sanitized:
                 continue
             key_value = entry.get("key")
             if isinstance(key_value, str) and key_value:
-                lookup[key_value] = sanitized
-                lookup[Path(key_value).name] = sanitized
-            identifier = entry.get("id")
-            if isinstance(identifier, str) and identifier:
-                lookup[identifier] = sanitized
-            slug = entry.get("slug")
-            if isinstance(slug, str) and slug:
-                lookup[slug] = sanitized
-        return lookup
+                append((key_value, sanitized))
+                append((key_value.rsplit("/", 1)[-1], sanitized))
+            for attr in ("id", "slug"):
+                value = entry.get(attr)
+                if isinstance(value, str) and value:
+                    append((value, sanitized))
+        return dict(items)
 
     def _extract_primary_lora_name(self, job: DispatchEnvelope) -> Optional[str]:
         extra = job.parameters.extra or {}
@@ -1090,11 +1550,11 @@ class GPUAgent:
             if display:
                 return display
         key = asset.key
-        candidates = [key, Path(key).name]
-        for candidate in candidates:
+        base_name = key.rsplit("/", 1)[-1]
+        for candidate in (key, base_name):
             if candidate in lookup:
                 return lookup[candidate]
-        return Path(key).name
+        return base_name
 
     def _sanitize_text(self, value: Optional[str]) -> str:
         if value is None:
@@ -1106,6 +1566,8 @@ class GPUAgent:
         return sanitized or None
 
     def _coerce_positive_int(self, value: Any) -> Optional[int]:
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value if value > 0 else None
         candidate = self._as_float(value)
         if candidate is None:
             return None
@@ -1130,6 +1592,8 @@ class GPUAgent:
         return secrets.randbelow(1_000_000_000)
 
     def _normalize_seed_value(self, value: Any) -> int:
+        if isinstance(value, int) and not isinstance(value, bool):
+            return abs(value) % 1_000_000_000
         if isinstance(value, (int, float)) and isfinite(value):
             normalized = abs(int(value))
             return normalized % 1_000_000_000
@@ -1145,7 +1609,7 @@ class GPUAgent:
     def _slugify_component(self, value: str, fallback: str, *, length: int = 32) -> str:
         base = normalize_name(value) if value else ""
         candidate = base or fallback
-        candidate = re.sub(r"[^A-Za-z0-9_-]+", "-", candidate).strip("-_.")
+        candidate = self._SLUG_RE.sub("-", candidate).strip("-_.")
         if not candidate:
             candidate = fallback
         if len(candidate) > length:
@@ -1220,21 +1684,23 @@ class GPUAgent:
             context["loras_metadata"] = lora_metadata
         primary_lora_context = self._derive_primary_lora_context(loras, lora_metadata)
         context.update(primary_lora_context)
-        defaults = self.config.workflow_defaults or {}
+        defaults = self.config.workflow_defaults
         # 1) Defaults anwenden
-        for key, value in defaults.items():
-            if key in self._RESERVED_DEFAULT_KEYS and key not in self._RESERVED_KEYS_WITH_DEFAULTS:
-                continue
-            if key not in context and value is not None:
-                context[key] = value
+        if defaults:
+            for key, value in defaults.items():
+                if key in self._RESERVED_DEFAULT_KEYS and key not in self._RESERVED_KEYS_WITH_DEFAULTS:
+                    continue
+                if key not in context and value is not None:
+                    context[key] = value
 
         # 2) Apply extra payload
-        for key, value in extra_payload.items():
-            if key in {"loras", "primary_lora_name", "primary_lora_strength_model", "primary_lora_strength_clip"}:
-                continue
-            if key in self._RESERVED_DEFAULT_KEYS and key not in self._RESERVED_KEYS_WITH_DEFAULTS:
-                continue
-            context[key] = value
+        if extra_payload:
+            for key, value in extra_payload.items():
+                if key in self._SKIP_EXTRA_KEYS:
+                    continue
+                if key in self._RESERVED_DEFAULT_KEYS and key not in self._RESERVED_KEYS_WITH_DEFAULTS:
+                    continue
+                context[key] = value
 
         # 3) Alias bridge for sampler_name / scheduler_name
         alias_map = {
@@ -1282,6 +1748,8 @@ class GPUAgent:
 
     def _values_match(self, expected: Any, actual: Any) -> bool:
         if isinstance(expected, int):
+            if isinstance(actual, int) and not isinstance(actual, bool):
+                return expected == actual
             numeric = self._as_float(actual)
             if numeric is None:
                 return False
@@ -1298,15 +1766,13 @@ class GPUAgent:
 
     def _resolve_workflow_value(
         self,
-        workflow: Dict[str, Any],
+        node_index: Dict[str, Dict[str, Any]],
         node_id: int,
         path: str,
         parameter: str,
     ) -> Any:
-        node = workflow.get(str(node_id))
-        if not isinstance(node, dict):
-            node = workflow.get(node_id)
-        if not isinstance(node, dict):
+        node = node_index.get(str(node_id))
+        if node is None:
             raise ValidationFailure(f"Workflow node {node_id} missing for parameter '{parameter}'")
         target: Any = node
         for part in path.split("."):
@@ -1327,6 +1793,10 @@ class GPUAgent:
         if not job.workflowParameters:
             return
 
+        # Normalize node keys once so each binding costs a single dict lookup.
+        node_index: Dict[str, Dict[str, Any]] = {
+            str(key): value for key, value in workflow.items() if isinstance(value, dict)
+        }
         mismatches: List[str] = []
         for binding in job.workflowParameters:
             parameter = binding.parameter
@@ -1334,7 +1804,7 @@ class GPUAgent:
                 continue
             try:
                 actual = self._resolve_workflow_value(
-                    workflow, binding.node, binding.path, parameter
+                    node_index, binding.node, binding.path, parameter
                 )
             except ValidationFailure as exc:
                 mismatches.append(str(exc))
@@ -1349,16 +1819,18 @@ class GPUAgent:
             raise ValidationFailure("; ".join(mismatches))
 
     def _validate_prompt_connections(self, workflow: Dict[str, Any]) -> None:
-        lookup: Dict[str, Dict[str, Any]] = {
-            str(node_id): node
-            for node_id, node in workflow.items()
-            if isinstance(node, dict)
-        }
-        issues: List[str] = []
-        for node_id, node in lookup.items():
-            class_type = str(node.get("class_type") or "").lower()
-            if class_type != "ksampler":
+        lookup: Dict[str, Dict[str, Any]] = {}
+        ksamplers: List[Tuple[str, Dict[str, Any]]] = []
+        for raw_id, node in workflow.items():
+            if not isinstance(node, dict):
                 continue
+            node_key = str(raw_id)
+            lookup[node_key] = node
+            class_type = node.get("class_type")
+            if isinstance(class_type, str) and class_type.lower() == "ksampler":
+                ksamplers.append((node_key, node))
+        issues: List[str] = []
+        for node_id, node in ksamplers:
             inputs = node.get("inputs")
             if not isinstance(inputs, dict):
                 issues.append(f"KSampler node {node_id} missing inputs map")
@@ -1369,7 +1841,7 @@ class GPUAgent:
                     issues.append(f"KSampler node {node_id} missing '{key}' connection")
                     continue
                 target_id, _ = ref
-                target = lookup.get(str(target_id))
+                target = lookup.get(target_id)
                 if not isinstance(target, dict):
                     issues.append(
                         f"KSampler node {node_id} {key} input targets unknown node {target_id}"
@@ -1388,11 +1860,9 @@ class GPUAgent:
         entries = extra.get("loras") if isinstance(extra, dict) else None
         if not isinstance(entries, list):
             return []
-        metadata: List[Dict[str, Any]] = []
-        for entry in entries:
-            if isinstance(entry, dict):
-                metadata.append(dict(entry))
-        return metadata
+        # Downstream matching only reads these entries; the one writer,
+        # _synchronize_lora_context, intentionally updates the originals.
+        return [entry for entry in entries if isinstance(entry, dict)]
 
     def _derive_primary_lora_context(
         self,
@@ -1410,16 +1880,36 @@ class GPUAgent:
             "primary_lora_strength_clip": strength,
         }
 
-    def _collect_lora_nodes(self, workflow: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
-        nodes: List[Tuple[str, Dict[str, Any]]] = []
+    def _index_workflow(
+        self, workflow: Dict[str, Any]
+    ) -> Tuple[
+        List[Tuple[str, Dict[str, Any]]],
+        Dict[Tuple[str, int], List[Tuple[str, Dict[str, Any], str]]],
+    ]:
+        """Scan the workflow once, yielding LoRA loader nodes and an inbound-edge index.
+
+        The edge index maps ``(source_node_id, output_index)`` to the nodes and
+        input keys that consume that output, so redirecting connections later
+        touches only the affected edges instead of re-walking every node.
+        """
+        lora_nodes: List[Tuple[int, str, Dict[str, Any]]] = []
+        inbound: Dict[Tuple[str, int], List[Tuple[str, Dict[str, Any], str]]] = {}
         for key, node in workflow.items():
             if not isinstance(node, dict):
                 continue
+            node_id = str(key)
             class_type = str(node.get("class_type") or "").lower()
             if class_type == "loraloader":
-                nodes.append((str(key), node))
-        nodes.sort(key=lambda item: int(item[0]) if str(item[0]).isdigit() else 0)
-        return nodes
+                lora_nodes.append((int(node_id) if node_id.isdigit() else 0, node_id, node))
+            inputs = node.get("inputs")
+            if not isinstance(inputs, dict):
+                continue
+            for input_key, value in inputs.items():
+                ref = self._as_connection_ref(value)
+                if ref is not None:
+                    inbound.setdefault(ref, []).append((node_id, node, input_key))
+        lora_nodes.sort(key=lambda item: item[0])
+        return [(node_id, node) for _, node_id, node in lora_nodes], inbound
 
     def _as_connection_ref(self, value: Any) -> Optional[Tuple[str, int]]:
         if isinstance(value, (list, tuple)) and len(value) == 2:
@@ -1439,27 +1929,20 @@ class GPUAgent:
 
     def _redirect_connections(
         self,
-        workflow: Dict[str, Any],
+        inbound: Dict[Tuple[str, int], List[Tuple[str, Dict[str, Any], str]]],
         mapping: Dict[str, Dict[int, Tuple[str, int]]],
         *,
         skip_nodes: Optional[Set[str]] = None,
     ) -> None:
         skip = {str(node) for node in skip_nodes} if skip_nodes else set()
-        for node_id, node in workflow.items():
-            if str(node_id) in skip or not isinstance(node, dict):
-                continue
-            inputs = node.get("inputs")
-            if not isinstance(inputs, dict):
-                continue
-            for key, value in list(inputs.items()):
-                ref = self._as_connection_ref(value)
-                if not ref:
-                    continue
-                target, index = ref
-                replacement = mapping.get(target, {}).get(index)
-                if not replacement:
-                    continue
-                inputs[key] = [str(replacement[0]), replacement[1]]
+        for target, replacements in mapping.items():
+            for index, replacement in replacements.items():
+                for node_id, node, input_key in inbound.get((target, index), ()):
+                    if node_id in skip:
+                        continue
+                    inputs = node.get("inputs")
+                    if isinstance(inputs, dict):
+                        inputs[input_key] = [str(replacement[0]), replacement[1]]
 
     def _apply_lora_chain(
         self,
@@ -1467,7 +1950,7 @@ class GPUAgent:
         loras: Sequence[ResolvedAsset],
         resolved_params: Dict[str, Any],
     ) -> List[Tuple[str, float]]:
-        lora_nodes = self._collect_lora_nodes(workflow)
+        lora_nodes, inbound_edges = self._index_workflow(workflow)
         if not lora_nodes:
             return []
 
@@ -1480,6 +1963,7 @@ class GPUAgent:
 
         metadata_entries = resolved_params.get("loras_metadata")
         metadata = metadata_entries if isinstance(metadata_entries, list) else []
+        metadata_index = self._build_lora_metadata_index(metadata) if metadata else {}
 
         applied: List[Tuple[str, float]] = []
         redirect: Dict[str, Dict[int, Tuple[str, int]]] = {}
@@ -1491,15 +1975,20 @@ class GPUAgent:
         if not loras:
             workflow.pop(template_id, None)
             redirect[template_id] = {0: upstream_model, 1: upstream_clip}
-            self._redirect_connections(workflow, redirect)
+            self._redirect_connections(inbound_edges, redirect)
             return []
 
-        prototype = copy.deepcopy(template_node)
+        # Serialized once; each chained node is cloned with a json round-trip,
+        # which copies the JSON-shaped template far faster than deepcopy.
+        prototype_json = json.dumps(template_node)
         keep_nodes: Set[str] = {template_id}
         last_node_id = template_id
+        # One scan for the current maximum; subsequent ids come from a local
+        # counter instead of re-walking the workflow per added node.
+        next_node_id = int(self._allocate_node_id(workflow))
 
         for index, asset in enumerate(loras):
-            payload = self._match_lora_metadata(asset, metadata)
+            payload = self._match_lora_metadata(asset, metadata, metadata_index)
             strength = self._normalize_strength(self._extract_strength_value(payload))
             if index == 0:
                 inputs["model"] = [upstream_model[0], upstream_model[1]]
@@ -1510,8 +1999,9 @@ class GPUAgent:
                 applied.append((asset.comfy_name, strength))
                 continue
 
-            new_id = self._allocate_node_id(workflow)
-            new_node = copy.deepcopy(prototype)
+            new_id = str(next_node_id)
+            next_node_id += 1
+            new_node = json.loads(prototype_json)
             new_inputs = new_node.setdefault("inputs", {})
             new_inputs["model"] = [last_node_id, 0]
             new_inputs["clip"] = [last_node_id, 1]
@@ -1526,7 +2016,7 @@ class GPUAgent:
 
         if applied:
             redirect[template_id] = {0: (last_node_id, 0), 1: (last_node_id, 1)}
-        self._redirect_connections(workflow, redirect, skip_nodes=keep_nodes)
+        self._redirect_connections(inbound_edges, redirect, skip_nodes=keep_nodes)
         return applied
 
     def _synchronize_lora_context(
@@ -1554,17 +2044,31 @@ class GPUAgent:
 
         metadata_entries = extra.get("loras") if isinstance(extra, dict) else None
         if isinstance(metadata_entries, list) and resolved_loras:
+            # Normalize names and look up strengths once per resolved LoRA so
+            # the entry loop is down to plain assignments.
+            resolved_info = [
+                (
+                    entry.comfy_name,
+                    normalize_name(entry.asset.original_name) if entry.asset.original_name else None,
+                    strengths.get(entry.comfy_name),
+                )
+                for entry in resolved_loras
+            ]
             for index, entry in enumerate(metadata_entries):
+                if index >= len(resolved_info):
+                    break
                 if not isinstance(entry, dict):
                     continue
-                if index < len(resolved_loras):
-                    entry["filename"] = resolved_loras[index].comfy_name
-                    original = resolved_loras[index].asset.original_name or entry.get("originalName")
-                    if isinstance(original, str) and original:
-                        entry["originalName"] = normalize_name(original)
-                    strength = strengths.get(resolved_loras[index].comfy_name)
-                    if strength is not None:
-                        entry["strength"] = strength
+                comfy_name, original_norm, strength = resolved_info[index]
+                entry["filename"] = comfy_name
+                if original_norm:
+                    entry["originalName"] = original_norm
+                else:
+                    existing = entry.get("originalName")
+                    if isinstance(existing, str) and existing:
+                        entry["originalName"] = normalize_name(existing)
+                if strength is not None:
+                    entry["strength"] = strength
         elif not applied_loras and isinstance(extra, dict):
             extra.pop("loras", None)
 
@@ -1587,13 +2091,17 @@ class GPUAgent:
         workflow: Dict[str, Any],
     ) -> None:
         directory = log_handle.directory if log_handle else self.config.paths.outputs / "logs" / job.jobId
-        try:
+        payload = {"prompt": workflow, "client_id": self.config.comfyui.client_id}
+
+        def _write() -> None:
             directory.mkdir(parents=True, exist_ok=True)
             path = directory / "applied-workflow.json"
-            payload = {"prompt": workflow, "client_id": self.config.comfyui.client_id}
-            with path.open("w", encoding="utf-8") as handle:
-                json.dump(payload, handle, indent=2, ensure_ascii=False)
-                handle.write("\n")
+            path.write_bytes(_dump_json_bytes(payload, indent=True) + b"\n")
+
+        try:
+            # Serialization and disk I/O happen off the event loop so status
+            # callbacks for other jobs keep flowing during large writes.
+            await asyncio.to_thread(_write)
         except Exception:  # noqa: BLE001
             LOGGER.debug("Failed to persist applied workflow for job %s", job.jobId, exc_info=True)
 
@@ -1613,24 +2121,41 @@ class GPUAgent:
             "resolvedParameters": resolved_params,
             "workflow": workflow,
         }
+        tmp_path = log_handle.manifest_path.with_suffix(".json.tmp")
+
+        def _write() -> None:
+            tmp_path.write_bytes(_dump_json_bytes(snapshot, indent=True) + b"\n")
+            os.replace(tmp_path, log_handle.manifest_path)
+
         try:
-            with log_handle.manifest_path.open("w", encoding="utf-8") as handle:
-                json.dump(snapshot, handle, indent=2, ensure_ascii=False)
-                handle.write("\n")
+            await asyncio.to_thread(_write)
         except Exception:  # noqa: BLE001
             LOGGER.debug("Failed to update manifest for job %s", job.jobId, exc_info=True)
+            tmp_path.unlink(missing_ok=True)
+
+    def _build_lora_metadata_index(
+        self, metadata: Sequence[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Normalize every matchable field once, keyed for O(1) lookups."""
+        index: Dict[str, Dict[str, Any]] = {}
+        for entry in metadata:
+            for field in self._LORA_MATCH_FIELDS:
+                value = entry.get(field)
+                if isinstance(value, str):
+                    index.setdefault(normalize_name(value), entry)
+        return index
+
     def _match_lora_metadata(
         self,
         target: ResolvedAsset,
         metadata: Sequence[Dict[str, Any]],
+        index: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> Optional[Dict[str, Any]]:
-        target_name = target.comfy_name
-        for entry in metadata:
-            for field in ("filename", "key", "name", "title", "id", "slug"):
-                value = entry.get(field)
-                if isinstance(value, str) and normalize_name(value) == target_name:
-                    return entry
-        return metadata[0] if metadata else None
+        if not metadata:
+            return None
+        if index is None:
+            index = self._build_lora_metadata_index(metadata)
+        return index.get(target.comfy_name, metadata[0])
 
     def _extract_strength_value(self, payload: Optional[Dict[str, Any]]) -> Optional[float]:
         if not payload:
@@ -1649,6 +2174,13 @@ class GPUAgent:
         return round(clamped, 2)
 
     def _as_float(self, value: Any) -> Optional[float]:
+        # Exact-type checks first: floats and ints dominate this call and skip
+        # the isinstance tuple walk (bool falls through to the generic branch).
+        kind = type(value)
+        if kind is float:
+            return value if isfinite(value) else None
+        if kind is int:
+            return float(value)
         if isinstance(value, (int, float)):
             numeric = float(value)
         elif isinstance(value, str):
@@ -1662,7 +2194,7 @@ class GPUAgent:
             return None
         return numeric
 
-    def _upload_outputs(
+    async def _upload_outputs(
         self,
         job: DispatchEnvelope,
         outputs: List[OutputImage],
@@ -1670,9 +2202,6 @@ class GPUAgent:
         loras: List[ResolvedAsset],
         resolved_params: Dict[str, Any],
     ) -> UploadResult:
-        uploaded_keys: List[str] = []
-        missing_files: List[Path] = []
-        artifact_records: List[ArtifactRecord] = []
         output_root = Path(self.config.paths.outputs)
         seed_value = str(resolved_params.get("seed", job.parameters.seed or 0))
         lora_entries = resolved_params.get("loras")
@@ -1683,36 +2212,43 @@ class GPUAgent:
         negative_text = resolved_params.get("negative_prompt") or job.parameters.negativePrompt or ""
         steps_value = resolved_params.get("steps", job.parameters.steps or "")
 
-        for index, image in enumerate(outputs, start=1):
+        # Hash+upload each artifact in its own worker slot; results are keyed
+        # by index so callback payloads keep the original output order.
+        records: List[Optional[ArtifactRecord]] = [None] * len(outputs)
+        missing_slots: List[Optional[Path]] = [None] * len(outputs)
+        semaphore = asyncio.Semaphore(max(1, self.config.minio.upload_concurrency))
+
+        async def _process(index: int, image: OutputImage) -> None:
             output_dir = output_root / image.subfolder if image.subfolder else output_root
             source = output_dir / image.filename
-            if not source.exists():
-                LOGGER.warning("Expected output missing: %s", source)
-                missing_files.append(source)
-                continue
-            ext = Path(image.filename).suffix or ".png"
-            destination_key = f"comfy-outputs/{job.jobId}/{index:02d}_{seed_value}{ext}"
-            sha_value = compute_sha256(source)
-            metadata = {
-                "prompt": prompt_text,
-                "negative_prompt": negative_text,
-                "seed": seed_value,
-                "steps": str(steps_value),
-                "user": job.user.username,
-                "job_id": job.jobId,
-                "model": base_model.comfy_name,
-                "loras": lora_names,
-                "image_type": image.image_type or "output",
-                "sha256": sha_value,
-            }
-            self.minio.upload_file(job.output.bucket, destination_key, source, metadata)
-            uploaded_keys.append(destination_key)
-
-            rel_path = image.filename if not image.subfolder else f"{image.subfolder.rstrip('/')}/{image.filename}"
-            abs_path = str(source.resolve())
-            mime, _ = mimetypes.guess_type(image.filename)
-            artifact_records.append(
-                ArtifactRecord(
+            async with semaphore:
+                try:
+                    sha_value, size_bytes = await asyncio.to_thread(hash_and_size, source)
+                except FileNotFoundError:
+                    LOGGER.warning("Expected output missing: %s", source)
+                    missing_slots[index] = source
+                    return
+                ext = Path(image.filename).suffix or ".png"
+                destination_key = f"comfy-outputs/{job.jobId}/{index + 1:02d}_{seed_value}{ext}"
+                metadata = {
+                    "prompt": prompt_text,
+                    "negative_prompt": negative_text,
+                    "seed": seed_value,
+                    "steps": str(steps_value),
+                    "user": job.user.username,
+                    "job_id": job.jobId,
+                    "model": base_model.comfy_name,
+                    "loras": lora_names,
+                    "image_type": image.image_type or "output",
+                    "sha256": sha_value,
+                }
+                await asyncio.to_thread(
+                    self.minio.upload_file, job.output.bucket, destination_key, source, metadata
+                )
+                rel_path = image.filename if not image.subfolder else f"{image.subfolder.rstrip('/')}/{image.filename}"
+                abs_path = os.path.abspath(source)
+                mime, _ = mimetypes.guess_type(image.filename)
+                records[index] = ArtifactRecord(
                     node_id=image.node_id,
                     filename=image.filename,
                     subfolder=image.subfolder,
@@ -1720,47 +2256,52 @@ class GPUAgent:
                     abs_path=abs_path,
                     mime=mime or "image/png",
                     sha256=sha_value,
-                    size_bytes=source.stat().st_size,
+                    size_bytes=size_bytes,
                     s3_bucket=job.output.bucket,
                     s3_key=destination_key,
                     s3_url=self._build_s3_url(job.output.bucket, destination_key),
                 )
-            )
-        return UploadResult(uploaded=uploaded_keys, missing=missing_files, artifacts=artifact_records)
 
-    def _cleanup(self, base_model: Optional[ResolvedAsset], loras: List[ResolvedAsset]) -> None:
-        if base_model and self.config.cleanup.delete_downloaded_models:
-            if base_model.asset.cacheStrategy != "persistent" and base_model.downloaded:
-                try:
-                    LOGGER.info("Removing temporary model %s", base_model.cache_path)
-                    base_model.cache_path.unlink(missing_ok=True)
-                except Exception as exc:  # noqa: BLE001
-                    LOGGER.warning("Failed to remove model %s: %s", base_model.cache_path, exc)
-            if (
-                base_model.asset.cacheStrategy != "persistent"
-                and base_model.link_created
-                and base_model.symlink_path.is_symlink()
-            ):
-                try:
-                    base_model.symlink_path.unlink(missing_ok=True)
-                except Exception as exc:  # noqa: BLE001
-                    LOGGER.debug("Failed to remove model symlink %s: %s", base_model.symlink_path, exc)
+        if outputs:
+            await asyncio.gather(*(_process(index, image) for index, image in enumerate(outputs)))
+        artifact_records = [record for record in records if record is not None]
+        return UploadResult(
+            uploaded=[record.s3_key for record in artifact_records],
+            missing=[path for path in missing_slots if path is not None],
+            artifacts=artifact_records,
+        )
+
+    async def _cleanup(self, base_model: Optional[ResolvedAsset], loras: List[ResolvedAsset]) -> None:
+        files: List[Path] = []
+        links: List[Path] = []
+        if (
+            base_model
+            and self.config.cleanup.delete_downloaded_models
+            and base_model.asset.cacheStrategy != "persistent"
+        ):
+            if base_model.downloaded:
+                LOGGER.info("Removing temporary model %s", base_model.cache_path)
+                files.append(base_model.cache_path)
+            if base_model.link_created:
+                links.append(base_model.symlink_path)
 
         if self.config.cleanup.delete_downloaded_loras:
             for entry in loras:
                 if entry.asset.cacheStrategy == "persistent":
                     continue
                 if entry.downloaded:
-                    try:
-                        LOGGER.info("Removing temporary LoRA %s", entry.cache_path)
-                        entry.cache_path.unlink(missing_ok=True)
-                    except Exception as exc:  # noqa: BLE001
-                        LOGGER.warning("Failed to remove LoRA %s: %s", entry.cache_path, exc)
-                if entry.link_created and entry.symlink_path.is_symlink():
-                    try:
-                        entry.symlink_path.unlink(missing_ok=True)
-                    except Exception as exc:  # noqa: BLE001
-                        LOGGER.debug("Failed to remove LoRA symlink %s: %s", entry.symlink_path, exc)
+                    LOGGER.info("Removing temporary LoRA %s", entry.cache_path)
+                    files.append(entry.cache_path)
+                if entry.link_created:
+                    links.append(entry.symlink_path)
+
+        if not files and not links:
+            return
+        # One thread hop for the whole batch instead of per-target unlinks
+        # (each preceded by its own is_symlink stat) on the event loop.
+        failures = await asyncio.to_thread(_bulk_unlink, files, links)
+        for path, exc in failures:
+            LOGGER.warning("Failed to remove %s: %s", path, exc)
 
     def _normalize_failure_reason(self, reason: Optional[str]) -> str:
         if not reason:
@@ -1817,7 +2358,26 @@ class GPUAgent:
         if snapshot:
             payload["activity_snapshot"] = snapshot
         idempotency_key = f"{job.jobId}-{state.value}-{heartbeat_seq}"
-        await self._post_callback(job.callbacks.status, payload, idempotency_key=idempotency_key)
+        if state in self._TERMINAL_STATES:
+            # Terminal states flush immediately and supersede any queued heartbeat.
+            self._pending_status.pop(job.jobId, None)
+            await self._post_callback(job.callbacks.status, payload, idempotency_key=idempotency_key)
+            return
+        self._pending_status[job.jobId] = (job.callbacks.status, payload, idempotency_key)
+        if self._status_flusher is None or self._status_flusher.done():
+            self._status_flusher = asyncio.create_task(self._flush_status_loop())
+        self._status_event.set()
+
+    async def _flush_status_loop(self) -> None:
+        """Post the newest queued heartbeat per job at a bounded cadence."""
+        while True:
+            await self._status_event.wait()
+            self._status_event.clear()
+            await asyncio.sleep(0.05)
+            pending = list(self._pending_status.values())
+            self._pending_status.clear()
+            for url, payload, idempotency_key in pending:
+                await self._post_callback(url, payload, idempotency_key=idempotency_key)
 
     async def _emit_completion(
         self,
@@ -1838,11 +2398,7 @@ class GPUAgent:
         if not job.callbacks or not job.callbacks.completion:
             return
         runtime = self._get_runtime(job.jobId)
-        started_at_iso = (
-            runtime.started_at.isoformat(timespec="milliseconds").replace("+00:00", "Z")
-            if runtime
-            else None
-        )
+        started_at_iso = runtime.started_at_iso if runtime else None
         finished_at_iso = self._now_iso()
         status_payload = history.get("status") if isinstance(history, dict) else None
         status_str = None
@@ -1886,11 +2442,7 @@ class GPUAgent:
         if job.callbacks and job.callbacks.failure:
             runtime = self._get_runtime(job.jobId)
             finished_at_iso = self._now_iso()
-            started_at_iso = (
-                runtime.started_at.isoformat(timespec="milliseconds").replace("+00:00", "Z")
-                if runtime
-                else None
-            )
+            started_at_iso = runtime.started_at_iso if runtime else None
             payload: Dict[str, Any] = {
                 "job_id": job.jobId,
                 "client_id": self.config.comfyui.client_id,
@@ -1934,11 +2486,7 @@ class GPUAgent:
             LOGGER.debug("Failed to emit error status callback for %s", job.jobId, exc_info=True)
         runtime = self._get_runtime(job.jobId)
         finished_at_iso = self._now_iso()
-        started_at_iso = (
-            runtime.started_at.isoformat(timespec="milliseconds").replace("+00:00", "Z")
-            if runtime
-            else None
-        )
+        started_at_iso = runtime.started_at_iso if runtime else None
         payload: Dict[str, Any] = {
             "job_id": job.jobId,
             "client_id": self.config.comfyui.client_id,
@@ -1960,7 +2508,7 @@ class GPUAgent:
                 "duration_ms": duration_ms,
             }
         try:
-            activity = await self.describe_activity()
+            activity = await self.describe_activity(max_age=0.0)
         except Exception as exc:  # noqa: BLE001
             LOGGER.debug("Failed to capture final ComfyUI activity snapshot: %s", exc)
             activity = None
@@ -1971,35 +2519,9 @@ class GPUAgent:
         await self._post_callback(job.callbacks.failure, payload, idempotency_key=idempotency_key)
 
     def _resolve_callback_url(self, url: str) -> str:
-        candidate = str(url or "").strip()
-        if not candidate:
-            raise ValueError("Callback URL cannot be empty")
-
-        base = (self.config.callbacks.base_url or "").strip()
-        if candidate.startswith("http://") or candidate.startswith("https://"):
-            if not base:
-                return candidate
-            parsed_base = urlparse(base)
-            if not parsed_base.scheme or not parsed_base.netloc:
-                return candidate
-            parsed_candidate = urlparse(candidate)
-            return urlunparse(
-                (
-                    parsed_base.scheme,
-                    parsed_base.netloc,
-                    parsed_candidate.path or "/",
-                    parsed_candidate.params,
-                    parsed_candidate.query,
-                    parsed_candidate.fragment,
-                )
-            )
-
-        if not base:
-            raise ValueError("Callback URL cannot be relative when no base URL configured")
-
-        normalized_base = f"{base.rstrip('/')}/"
-        normalized_candidate = candidate.lstrip("/")
-        return urljoin(normalized_base, normalized_candidate)
+        return _resolve_callback_target(
+            (self.config.callbacks.base_url or "").strip(), str(url or "").strip()
+        )
 
     async def _post_callback(
         self,
@@ -2014,32 +2536,33 @@ class GPUAgent:
             LOGGER.warning("Skipping callback with invalid target %s: %s", url, exc)
             return
         LOGGER.debug("Sending callback to %s: %s", target, payload)
-        verify = self.config.callbacks.verify_tls
-        timeout = httpx.Timeout(self.config.callbacks.timeout_seconds)
         max_attempts = max(1, int(self.config.callbacks.max_retries))
         backoff = max(0.0, float(self.config.callbacks.retry_backoff_seconds))
         headers = {"Content-Type": "application/json"}
         if idempotency_key:
             headers["Idempotency-Key"] = idempotency_key
-        async with httpx.AsyncClient(verify=verify, timeout=timeout) as client:
-            attempt = 0
-            while True:
-                attempt += 1
-                try:
-                    response = await client.post(target, json=payload, headers=headers)
-                    response.raise_for_status()
+        # Serialize once up front; retries resend the same bytes instead of
+        # re-encoding the payload on every attempt.
+        body = _dump_json_bytes(payload)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self._http.post(target, content=body, headers=headers)
+                response.raise_for_status()
+                return
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.warning("Callback to %s failed (attempt %s/%s): %s", target, attempt, max_attempts, exc)
+                if attempt >= max_attempts:
                     return
-                except Exception as exc:  # noqa: BLE001
-                    LOGGER.warning("Callback to %s failed (attempt %s/%s): %s", target, attempt, max_attempts, exc)
-                    if attempt >= max_attempts:
-                        return
-                    await asyncio.sleep(backoff * attempt)
+                await asyncio.sleep(backoff * attempt)
 
     def _compute_timeout(
         self,
         job: DispatchEnvelope,
-        workflow: Dict[str, Any],
         resolved_params: Dict[str, Any],
+        *,
+        low_denoise: bool,
     ) -> float:
         base_timeout = float(self.config.comfyui.timeout_seconds)
         per_step = float(self.config.comfyui.per_step_timeout_seconds)
@@ -2048,25 +2571,18 @@ class GPUAgent:
         if steps is None or steps <= 0:
             raise ValidationFailure("Resolved workflow parameters must include a positive 'steps' value")
         timeout = base_timeout + steps * per_step
-        if self._workflow_has_low_denoise(workflow):
+        if low_denoise:
             timeout *= float(self.config.comfyui.img2img_timeout_multiplier)
         return timeout
 
-    def _workflow_has_low_denoise(self, workflow: Dict[str, Any]) -> bool:
-        for node in workflow.values():
-            if not isinstance(node, dict):
-                continue
-            inputs = node.get("inputs")
-            if not isinstance(inputs, dict):
-                continue
-            denoise = inputs.get("denoise")
-            if isinstance(denoise, (int, float)) and float(denoise) < 1.0:
-                return True
-        return False
+    def _summarize_workflow(self, workflow: Dict[str, Any]) -> Tuple[bool, List[Tuple[str, str, str]]]:
+        """Collect the low-denoise flag and string node inputs in a single pass.
 
-    async def _validate_workflow_assets(self, workflow: Dict[str, Any]) -> None:
-        allowed = await self.comfyui.get_allowed_names()
-        violations: List[str] = []
+        Timeout scaling and asset validation both walk the final workflow; doing
+        it once here keeps each consumer down to a flat list scan.
+        """
+        has_low_denoise = False
+        string_inputs: List[Tuple[str, str, str]] = []
         for node_id, node in workflow.items():
             if not isinstance(node, dict):
                 continue
@@ -2074,16 +2590,30 @@ class GPUAgent:
             if not isinstance(inputs, dict):
                 continue
             for key, value in inputs.items():
-                if not isinstance(value, str):
-                    continue
-                normalized = normalize_name(value)
-                allowed_set = allowed.get(key)
-                if not allowed_set:
-                    continue
-                try:
-                    must_be_allowed(normalized, allowed_set, key)
-                except ValueError:
-                    violations.append(f"{key}='{normalized}' rejected for node {node_id}")
+                if isinstance(value, str):
+                    string_inputs.append((node_id, key, value))
+                elif (
+                    not has_low_denoise
+                    and key == "denoise"
+                    and isinstance(value, (int, float))
+                    and float(value) < 1.0
+                ):
+                    has_low_denoise = True
+        return has_low_denoise, string_inputs
+
+    async def _validate_workflow_assets(self, string_inputs: List[Tuple[str, str, str]]) -> None:
+        allowed = await self.comfyui.get_allowed_names()
+        violations: List[str] = []
+        norm_cache: Dict[str, str] = {}
+        for node_id, key, value in string_inputs:
+            allowed_set = allowed.get(key)
+            if not allowed_set:
+                continue
+            normalized = norm_cache.get(value)
+            if normalized is None:
+                normalized = norm_cache[value] = normalize_name(value)
+            if normalized not in allowed_set:
+                violations.append(f"{key}='{normalized}' rejected for node {node_id}")
         if violations:
             raise ValidationFailure("; ".join(violations))
 
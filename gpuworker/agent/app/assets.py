@@ -17,9 +17,12 @@ def must_be_allowed(name: str, allowed: set[str], kind: str) -> None:
 
 
 def ensure_extension(name: str, fallback: str = ".safetensors") -> str:
-    candidate = Path(normalize_name(name))
+    sanitized = normalize_name(name)
+    if len(sanitized) > len(fallback) and sanitized.endswith(fallback):
+        return sanitized
+    candidate = Path(sanitized)
     suffix = candidate.suffix or fallback
-    stem = candidate.stem or Path(normalize_name(name)).stem or "model"
+    stem = candidate.stem or "model"
     return f"{stem}{suffix}"
 
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import time
 from asyncio import Event
 from dataclasses import dataclass
@@ -188,9 +189,15 @@ class ComfyUIClient:
         lora_dir = self.config.paths.loras
 
         def collect(directory: Path) -> Set[str]:
-            if not directory.exists():
+            try:
+                with os.scandir(directory) as entries:
+                    return {
+                        normalize_name(entry.name)
+                        for entry in entries
+                        if entry.name.endswith(".safetensors") and entry.is_file(follow_symlinks=True)
+                    }
+            except OSError:
                 return set()
-            return {normalize_name(path.name) for path in directory.glob("*.safetensors")}
 
         mapping: Dict[str, Set[str]] = {
             "ckpt_name": collect(base_models),
@@ -7,6 +7,11 @@ from typing import Any, Dict, List, Optional
 
 import yaml
 
+try:  # libyaml is several-fold faster than the pure-Python loader when present
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _SafeLoader
+
 
 @dataclass
 class MinioConfig:
@@ -16,6 +21,8 @@ class MinioConfig:
     secure: bool = False
     region: Optional[str] = None
     verify_tls: bool = True
+    parallel_downloads: int = 4
+    upload_concurrency: int = 10
 
 
 @dataclass
@@ -60,6 +67,7 @@ class AgentConfig:
     comfyui: ComfyUIConfig
     paths: PathConfig
     persistent_model_keys: List[str] = field(default_factory=list)
+    asset_cache_size: int = 8
     cleanup: CleanupConfig = field(default_factory=CleanupConfig)
     callbacks: CallbackConfig = field(default_factory=CallbackConfig)
     workflow_defaults: Dict[str, Any] = field(default_factory=dict)
@@ -130,8 +138,7 @@ def load_config(path: str | os.PathLike[str]) -> AgentConfig:
     if not cfg_path.exists():
         raise FileNotFoundError(f"Agent configuration missing: {cfg_path}")
 
-    with cfg_path.open("r", encoding="utf-8") as handle:
-        payload = yaml.safe_load(handle) or {}
+    payload = yaml.load(cfg_path.read_text(encoding="utf-8"), Loader=_SafeLoader) or {}
 
     def _require(section: str, key: str) -> Any:
         if section not in payload or payload[section] is None:
@@ -147,6 +154,8 @@ def load_config(path: str | os.PathLike[str]) -> AgentConfig:
         secure=bool(payload.get("minio", {}).get("secure", False)),
         region=payload.get("minio", {}).get("region"),
         verify_tls=bool(payload.get("minio", {}).get("verify_tls", True)),
+        parallel_downloads=int(payload.get("minio", {}).get("parallel_downloads", 4)),
+        upload_concurrency=int(payload.get("minio", {}).get("upload_concurrency", 10)),
     )
 
     comfy_section = payload.get("comfyui", {}) or {}
@@ -183,6 +192,7 @@ def load_config(path: str | os.PathLike[str]) -> AgentConfig:
     )
 
     persistent_model_keys = list(payload.get("persistent_model_keys", []) or [])
+    asset_cache_size = int(payload.get("asset_cache_size", 8))
     workflow_defaults = dict(payload.get("workflow_defaults", {}) or {})
 
     config = AgentConfig(
@@ -190,6 +200,7 @@ def load_config(path: str | os.PathLike[str]) -> AgentConfig:
         comfyui=comfy_cfg,
         paths=paths_cfg,
         persistent_model_keys=persistent_model_keys,
+        asset_cache_size=asset_cache_size,
         cleanup=cleanup_cfg,
         callbacks=callbacks_cfg,
         workflow_defaults=workflow_defaults,
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import mmap
+import os
 from pathlib import Path
 from typing import Iterable, Optional
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config as BotoConfig
 
 from .config import AgentConfig
@@ -30,11 +33,55 @@ class MinioManager:
             verify=config.minio.verify_tls,
         )
         self.config = config
+        # Split large artifacts into concurrent multipart transfers instead of one
+        # serial PUT; small files stay below the threshold and keep the single-call path.
+        self._transfer_config = TransferConfig(
+            multipart_threshold=64 * 1024 * 1024,
+            multipart_chunksize=16 * 1024 * 1024,
+            max_concurrency=max(1, config.minio.upload_concurrency),
+        )
+        # Same idea on the way down: fetch large checkpoints as concurrent
+        # byte-range GETs instead of one sequential stream.
+        self._download_config = TransferConfig(
+            multipart_threshold=64 * 1024 * 1024,
+            multipart_chunksize=16 * 1024 * 1024,
+            max_concurrency=max(1, config.minio.parallel_downloads),
+        )
 
-    def download_to_path(self, bucket: str, key: str, destination: Path) -> Path:
+    def download_to_path(
+        self,
+        bucket: str,
+        key: str,
+        destination: Path,
+        expected_sha256: Optional[str] = None,
+    ) -> Path:
         destination.parent.mkdir(parents=True, exist_ok=True)
         LOGGER.info("Downloading s3://%s/%s -> %s", bucket, key, destination)
-        self.client.download_file(bucket, key, str(destination))
+        if not expected_sha256:
+            self.client.download_file(bucket, key, str(destination), Config=self._download_config)
+            return destination
+
+        # Hash the stream while it lands on disk so verification does not need a
+        # second full read of a multi-GB checkpoint. Stage under a temp name and
+        # publish with an atomic rename only after the digest checks out, so an
+        # interrupted transfer never leaves a truncated file at the cache path.
+        body = self.client.get_object(Bucket=bucket, Key=key)["Body"]
+        digest = hashlib.sha256()
+        tmp_path = destination.with_name(destination.name + ".part")
+        try:
+            with tmp_path.open("wb") as handle:
+                for chunk in iter(lambda: body.read(8 * 1024 * 1024), b""):
+                    digest.update(chunk)
+                    handle.write(chunk)
+            expected = expected_sha256.lower().removeprefix("sha256:")
+            if digest.hexdigest() != expected:
+                raise ValueError(
+                    f"Checksum mismatch for s3://{bucket}/{key}: expected {expected}, got {digest.hexdigest()}"
+                )
+            os.replace(tmp_path, destination)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
         return destination
 
     def upload_file(self, bucket: str, key: str, source: Path, extra_metadata: Optional[dict[str, str]] = None) -> None:
@@ -49,6 +96,7 @@ class MinioManager:
             ExtraArgs={
                 "Metadata": metadata,
             },
+            Config=self._transfer_config,
         )
 
     def ensure_objects(self, assets: Iterable[tuple[str, str]]) -> None:
@@ -75,3 +123,19 @@ def compute_sha256(path: Path) -> str:
             digest.update(chunk)
     return digest.hexdigest()
 
+
+def hash_and_size(path: Path) -> tuple[str, int]:
+    """Return (sha256 hex digest, size in bytes) from one open/fstat pass.
+
+    The file is fed to hashlib as a single mmap-backed view, letting OpenSSL
+    run at hardware rate without a Python-level chunk loop; the size rides
+    along from the same descriptor.
+    """
+    with path.open("rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        digest = hashlib.sha256()
+        if size:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                digest.update(view)
+        return digest.hexdigest(), size
+
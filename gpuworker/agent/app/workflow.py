@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import json
 import logging
-from copy import deepcopy
 from pathlib import Path
 from typing import Any, Dict, Iterable, Set
 
@@ -20,7 +19,9 @@ class WorkflowLoader:
 
     def load(self, job: DispatchEnvelope) -> Dict[str, Any]:
         if job.workflow.inline is not None:
-            base = deepcopy(job.workflow.inline)
+            # json round-trip clones the JSON-shaped payload in C, several times
+            # faster than copy.deepcopy walking the object graph node by node.
+            base = json.loads(json.dumps(job.workflow.inline))
             LOGGER.debug("Using inline workflow payload for job %s", job.jobId)
         elif job.workflow.localPath is not None:
             path = Path(job.workflow.localPath)
@@ -49,8 +49,16 @@ if [[ -n "${ORIGINAL_USER}" ]]; then
 else
   echo "Running git pull as $(id -un)"
 fi
+PRE_PULL_HEAD="$(git -C "${REPO_DIR}" rev-parse HEAD)"
 run_as_user "${ORIGINAL_USER}" git -C "${REPO_DIR}" fetch --tags
 run_as_user "${ORIGINAL_USER}" git -C "${REPO_DIR}" pull --ff-only
+POST_PULL_HEAD="$(git -C "${REPO_DIR}" rev-parse HEAD)"
+
+if [[ "${PRE_PULL_HEAD}" == "${POST_PULL_HEAD}" ]] && command -v systemctl >/dev/null 2>&1 \
+  && systemctl is-active --quiet "${SERVICE_NAME}"; then
+  echo "Repository already at ${POST_PULL_HEAD}; agent service is running. Nothing to update."
+  exit 0
+fi
 
 if [[ ! -d "${AGENT_SOURCE_DIR}" ]]; then
   echo "Source agent directory not found at ${AGENT_SOURCE_DIR}." >&2
@@ -69,7 +69,7 @@ def create_app() -> FastAPI:
 
     @app.on_event("shutdown")
     async def shutdown_event() -> None:  # pragma: no cover - FastAPI event
-        await agent.comfyui.close()
+        await agent.aclose()
 
     return app
 
@@ -45,8 +45,7 @@ class JobLoggingTests(unittest.TestCase):
         self.agent = GPUAgent.__new__(GPUAgent)
         self.agent.config = SimpleNamespace(paths=SimpleNamespace(outputs=outputs, temp=temp))
         self.agent._job_log_dir = outputs / "logs"
-        self.agent._job_logs = {}
-        self.agent._runtime = {}
+        self.agent._jobs = {}
         self.agent._cancel_handle = None
 
     def test_manifest_and_events_written(self) -> None:
@@ -82,8 +81,7 @@ class CancellationLoggingTests(unittest.IsolatedAsyncioTestCase):
         self.agent = GPUAgent.__new__(GPUAgent)
         self.agent.config = SimpleNamespace(paths=SimpleNamespace(outputs=outputs, temp=temp))
         self.agent._job_log_dir = outputs / "logs"
-        self.agent._job_logs = {}
-        self.agent._runtime = {}
+        self.agent._jobs = {}
         self.agent._cancel_handle = None
 
         self.job = _build_job("job-cancel")
@@ -58,6 +58,59 @@ class LoraMaterializationTests(unittest.TestCase):
         self.assertTrue(link.is_symlink())
         self.assertTrue(link.samefile(target))
 
+    def test_ensure_symlink_reuses_link_already_pointing_at_target(self) -> None:
+        target = self.loras_dir / "payload.safetensors"
+        target.write_text("data", encoding="utf-8")
+        desired = self.base_dir / "hero.safetensors"
+        desired.symlink_to(target)
+
+        link, created = self.agent._ensure_symlink(
+            desired,
+            target,
+            source_key="loras/hero.safetensors",
+        )
+
+        self.assertFalse(created)
+        self.assertEqual(link, desired)
+        self.assertTrue(link.is_symlink())
+        self.assertTrue(link.samefile(target))
+
+    def test_ensure_symlink_replaces_dangling_link(self) -> None:
+        target = self.loras_dir / "payload.safetensors"
+        target.write_text("data", encoding="utf-8")
+        desired = self.base_dir / "hero.safetensors"
+        desired.symlink_to(self.loras_dir / "gone.safetensors")
+
+        link, created = self.agent._ensure_symlink(
+            desired,
+            target,
+            source_key="loras/hero.safetensors",
+        )
+
+        self.assertTrue(created)
+        self.assertEqual(link, desired)
+        self.assertTrue(link.is_symlink())
+        self.assertTrue(link.samefile(target))
+
+    def test_ensure_symlink_suffixes_name_on_collision(self) -> None:
+        target = self.loras_dir / "payload.safetensors"
+        target.write_text("data", encoding="utf-8")
+        desired = self.base_dir / "hero.safetensors"
+        desired.write_text("occupied", encoding="utf-8")
+
+        link, created = self.agent._ensure_symlink(
+            desired,
+            target,
+            source_key="loras/hero.safetensors",
+        )
+
+        self.assertTrue(created)
+        self.assertNotEqual(link, desired)
+        self.assertTrue(link.name.startswith("hero__"))
+        self.assertTrue(link.is_symlink())
+        self.assertTrue(link.samefile(target))
+        self.assertEqual(desired.read_text(encoding="utf-8"), "occupied")
+
     def test_materialize_without_symlink_replaces_existing_payload(self) -> None:
         cache_dir = self.loras_dir
         pretty_path = cache_dir / "hero.safetensors"
@@ -0,0 +1,70 @@
+import hashlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from gpuworker.agent.app.minio_client import MinioManager
+
+
+class FakeS3Client:
+    def __init__(self, payload: bytes) -> None:
+        self.payload = payload
+
+    def get_object(self, Bucket: str, Key: str) -> dict:  # noqa: N803 - boto3 signature
+        return {"Body": io.BytesIO(self.payload)}
+
+
+class MinioDownloadTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.destination = Path(self.tempdir.name) / "cache" / "model.safetensors"
+        self.payload = b"model-weights"
+        self.manager = MinioManager.__new__(MinioManager)
+        self.manager.client = FakeS3Client(self.payload)
+
+    def tearDown(self) -> None:
+        self.tempdir.cleanup()
+
+    def test_download_accepts_matching_checksum(self) -> None:
+        digest = hashlib.sha256(self.payload).hexdigest()
+
+        result = self.manager.download_to_path(
+            "models",
+            "base/model.safetensors",
+            self.destination,
+            expected_sha256=digest,
+        )
+
+        self.assertEqual(result, self.destination)
+        self.assertEqual(self.destination.read_bytes(), self.payload)
+
+    def test_download_normalizes_prefixed_uppercase_checksum(self) -> None:
+        digest = hashlib.sha256(self.payload).hexdigest()
+
+        result = self.manager.download_to_path(
+            "models",
+            "base/model.safetensors",
+            self.destination,
+            expected_sha256=f"SHA256:{digest.upper()}",
+        )
+
+        self.assertEqual(result, self.destination)
+        self.assertEqual(self.destination.read_bytes(), self.payload)
+
+    def test_download_rejects_checksum_mismatch_and_removes_file(self) -> None:
+        wrong = hashlib.sha256(b"something-else").hexdigest()
+
+        with self.assertRaises(ValueError):
+            self.manager.download_to_path(
+                "models",
+                "base/model.safetensors",
+                self.destination,
+                expected_sha256=wrong,
+            )
+
+        self.assertFalse(self.destination.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
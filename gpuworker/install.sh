@@ -262,13 +262,14 @@ ensure_user() {
 clone_repo() {
   if [[ -d "$COMFY_DIR/.git" ]]; then
     log "Updating existing ComfyUI checkout"
-    git -C "$COMFY_DIR" fetch origin
-    git -C "$COMFY_DIR" checkout "$COMFY_BRANCH"
-    git -C "$COMFY_DIR" pull --ff-only origin "$COMFY_BRANCH"
+    # A shallow fetch grafts the new tip without history, so a fast-forward
+    # pull cannot connect it to the local branch; check out FETCH_HEAD directly.
+    git -C "$COMFY_DIR" fetch --depth=1 origin "$COMFY_BRANCH"
+    git -C "$COMFY_DIR" checkout -B "$COMFY_BRANCH" FETCH_HEAD
   else
     log "Cloning ComfyUI into $COMFY_DIR"
     install -d -m 0755 "$COMFY_DIR"
-    git clone --branch "$COMFY_BRANCH" "$COMFY_REPO" "$COMFY_DIR"
+    git clone --depth=1 --filter=blob:none --single-branch --branch "$COMFY_BRANCH" "$COMFY_REPO" "$COMFY_DIR"
   fi
   chown -R "$COMFY_USER":"$COMFY_GROUP" "$COMFY_DIR"
 }